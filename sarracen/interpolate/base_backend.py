@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from numba.core.registry import CPUDispatcher
 from numpy import ndarray, zeros
@@ -20,7 +20,8 @@ class BaseBackend:
                               x_max: float,
                               y_min: float,
                               y_max: float,
-                              exact: bool) -> ndarray:
+                              exact: bool,
+                              out: Optional[ndarray] = None) -> ndarray:
         """ Interpolate 2D data to a 2D grid of pixels."""
         return zeros((y_pixels, x_pixels))
 
@@ -88,7 +89,8 @@ class BaseBackend:
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> ndarray:
+                                  exact: bool,
+                                  out: Optional[ndarray] = None) -> ndarray:
         """ Interpolate 3D data to a 2D pixel grid using column projection."""
         return zeros((y_pixels, x_pixels))
 
@@ -125,7 +127,8 @@ class BaseBackend:
                              x_min: float,
                              x_max: float,
                              y_min: float,
-                             y_max: float) -> ndarray:
+                             y_max: float,
+                             out: Optional[ndarray] = None) -> ndarray:
         """
         Interpolate 3D data to a pair of 2D pixel grids using a 3D
         cross-section at a specific z value.
@@ -170,8 +173,17 @@ class BaseBackend:
                             y_min: float,
                             y_max: float,
                             z_min: float,
-                            z_max: float) -> ndarray:
+                            z_max: float,
+                            out: Optional[ndarray] = None) -> ndarray:
         """
         Interpolate 3D data to a 3D grid of pixels.
         """
         return zeros((z_pixels, y_pixels, x_pixels))
+
+    @staticmethod
+    def _store(image: ndarray, out: Optional[ndarray]) -> ndarray:
+        """ Copy an interpolated image into `out`, if it is given. """
+        if out is None:
+            return image
+        out[...] = image
+        return out
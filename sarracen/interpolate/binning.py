@@ -0,0 +1,126 @@
+from typing import Tuple
+
+from numba import njit, prange
+from numpy import ndarray
+import numpy as np
+
+
+# Determine the weight of each particle, and the range of pixels that it
+# contributes to, in a single pass over the particles. Shared by the CPU and
+# GPU backends. Particles that are out of reach of the image plane, or that
+# carry no weight, are given an empty range so that they are never binned.
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def compute_bounds_and_term(x_data: ndarray,
+                            y_data: ndarray,
+                            dz: ndarray,
+                            w_data: ndarray,
+                            h_data: ndarray,
+                            kernel_radius: float,
+                            x_min: float,
+                            y_min: float,
+                            pixwidthx: float,
+                            pixwidthy: float,
+                            x_pixels: int,
+                            y_pixels: int,
+                            n_dims: int,
+                            term: ndarray,
+                            ipixmin: ndarray,
+                            ipixmax: ndarray,
+                            jpixmin: ndarray,
+                            jpixmax: ndarray) -> None:
+    for i in prange(x_data.size):
+        term[i] = w_data[i] / h_data[i] ** n_dims
+        rad = kernel_radius * h_data[i]
+
+        if abs(dz[i]) >= rad or term[i] == 0:
+            ipixmin[i] = 0
+            ipixmax[i] = 0
+            jpixmin[i] = 0
+            jpixmax[i] = 0
+            continue
+
+        ipixmin[i] = int(min(max(np.rint((x_data[i] - rad - x_min)
+                                         / pixwidthx), 0), x_pixels))
+        ipixmax[i] = int(min(max(np.rint((x_data[i] + rad - x_min)
+                                         / pixwidthx), 0), x_pixels))
+        jpixmin[i] = int(min(max(np.rint((y_data[i] - rad - y_min)
+                                         / pixwidthy), 0), y_pixels))
+        jpixmax[i] = int(min(max(np.rint((y_data[i] + rad - y_min)
+                                         / pixwidthy), 0), y_pixels))
+
+
+# Sort particles into square tiles of tile_size pixels, using a counting sort.
+# A particle is listed once in every tile that its range of pixels overlaps,
+# so a few large particles do not coarsen the binning of all the others. The
+# fields used during accumulation are written in tile order, so that each tile
+# reads its particles contiguously: rows of `particles` hold the x and y
+# position, distance from the image plane, smoothing length and weight, and
+# rows of `bounds` the range of pixels. The particles in tile t are rows
+# cell_start[t] to cell_start[t] + cell_count[t], where tiles are indexed by
+# jtile * x_tiles + itile. Particles are counted and placed in n_chunks
+# contiguous chunks in parallel, and chunks keep their order within each tile.
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def bin_particles(x_data: ndarray,
+                  y_data: ndarray,
+                  dz: ndarray,
+                  h_data: ndarray,
+                  term: ndarray,
+                  ipixmin: ndarray,
+                  ipixmax: ndarray,
+                  jpixmin: ndarray,
+                  jpixmax: ndarray,
+                  tile_size: int,
+                  x_tiles: int,
+                  y_tiles: int,
+                  n_chunks: int) -> Tuple[ndarray, ndarray, ndarray, ndarray]:
+    n_tiles = x_tiles * y_tiles
+    chunk_size = (x_data.size + n_chunks - 1) // n_chunks
+
+    chunk_count = np.zeros((n_chunks, n_tiles), dtype=np.int64)
+    for c in prange(n_chunks):
+        for i in range(c * chunk_size, min((c + 1) * chunk_size, x_data.size)):
+            if ipixmax[i] <= ipixmin[i] or jpixmax[i] <= jpixmin[i]:
+                continue
+            for jt in range(jpixmin[i] // tile_size,
+                            (jpixmax[i] - 1) // tile_size + 1):
+                for it in range(ipixmin[i] // tile_size,
+                                (ipixmax[i] - 1) // tile_size + 1):
+                    chunk_count[c, jt * x_tiles + it] += 1
+
+    # the first row of each chunk within each tile
+    cell_start = np.empty(n_tiles, dtype=np.int64)
+    cell_count = np.empty(n_tiles, dtype=np.int64)
+    chunk_start = np.empty((n_chunks, n_tiles), dtype=np.int64)
+    total = 0
+    for t in range(n_tiles):
+        cell_start[t] = total
+        for c in range(n_chunks):
+            chunk_start[c, t] = total
+            total += chunk_count[c, t]
+        cell_count[t] = total - cell_start[t]
+
+    particles = np.empty((total, 5), dtype=x_data.dtype)
+    bounds = np.empty((total, 4), dtype=np.int32)
+    for c in prange(n_chunks):
+        fill = chunk_start[c]
+        for i in range(c * chunk_size, min((c + 1) * chunk_size, x_data.size)):
+            if ipixmax[i] <= ipixmin[i] or jpixmax[i] <= jpixmin[i]:
+                continue
+            for jt in range(jpixmin[i] // tile_size,
+                            (jpixmax[i] - 1) // tile_size + 1):
+                for it in range(ipixmin[i] // tile_size,
+                                (ipixmax[i] - 1) // tile_size + 1):
+                    t = jt * x_tiles + it
+                    k = fill[t]
+                    fill[t] += 1
+                    particles[k, 0] = x_data[i]
+                    particles[k, 1] = y_data[i]
+                    particles[k, 2] = dz[i]
+                    particles[k, 3] = h_data[i]
+                    particles[k, 4] = term[i]
+                    bounds[k, 0] = ipixmin[i]
+                    bounds[k, 1] = ipixmax[i]
+                    bounds[k, 2] = jpixmin[i]
+                    bounds[k, 3] = jpixmax[i]
+
+    return cell_start, cell_count, particles, bounds
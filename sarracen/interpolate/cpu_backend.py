@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 from numba import njit, prange, get_num_threads
 from numba.core.registry import CPUDispatcher
@@ -6,6 +6,7 @@ from numpy import ndarray
 import numpy as np
 
 from ..interpolate.base_backend import BaseBackend
+from ..interpolate.binning import bin_particles, compute_bounds_and_term
 from ..kernels.cubic_spline_exact import line_int, surface_int
 
 
@@ -24,14 +25,19 @@ class CPUBackend(BaseBackend):
                               x_max: float,
                               y_min: float,
                               y_max: float,
-                              exact: bool) -> ndarray:
+                              exact: bool,
+                              out: Optional[ndarray] = None) -> ndarray:
         if exact:
-            return CPUBackend._exact_2d_render(x, y, weight, h, x_pixels,
-                                               y_pixels, x_min, x_max,
-                                               y_min, y_max)
+            image = CPUBackend._exact_2d_render(x, y, weight, h, x_pixels,
+                                                y_pixels, x_min, x_max,
+                                                y_min, y_max)
+            return CPUBackend._store(image, out)
+        if out is None:
+            out = np.empty((y_pixels, x_pixels), dtype=weight.dtype)
         return CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   out)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray,
@@ -55,12 +61,16 @@ class CPUBackend(BaseBackend):
                     CPUBackend._exact_2d_render(x, y, weight_y, h, x_pixels,
                                                 y_pixels, x_min, x_max,
                                                 y_min, y_max))
+        image_x = np.empty((y_pixels, x_pixels), dtype=weight_x.dtype)
+        image_y = np.empty((y_pixels, x_pixels), dtype=weight_y.dtype)
         return (CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2),
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    image_x),
                 CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2))
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    image_y))
 
     @staticmethod
     def interpolate_2d_line(x: ndarray,
@@ -110,14 +120,19 @@ class CPUBackend(BaseBackend):
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> ndarray:
+                                  exact: bool,
+                                  out: Optional[ndarray] = None) -> ndarray:
         if exact:
-            return CPUBackend._exact_3d_project(x, y, weight, h, x_pixels,
-                                                y_pixels, x_min, x_max,
-                                                y_min, y_max)
+            image = CPUBackend._exact_3d_project(x, y, weight, h, x_pixels,
+                                                 y_pixels, x_min, x_max,
+                                                 y_min, y_max)
+            return CPUBackend._store(image, out)
+        if out is None:
+            out = np.empty((y_pixels, x_pixels), dtype=weight.dtype)
         return CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   out)
 
     @staticmethod
     def interpolate_3d_projection_vec(x: ndarray,
@@ -141,12 +156,16 @@ class CPUBackend(BaseBackend):
                     CPUBackend._exact_3d_project(x, y, weight_y, h, x_pixels,
                                                  y_pixels, x_min, x_max,
                                                  y_min, y_max))
+        image_x = np.empty((y_pixels, x_pixels), dtype=weight_x.dtype)
+        image_y = np.empty((y_pixels, x_pixels), dtype=weight_y.dtype)
         return (CPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2),
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    image_x),
                 CPUBackend._fast_2d(x, y, np.zeros(y.size), 0, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 2))
+                                    y_pixels, x_min, x_max, y_min, y_max, 2,
+                                    image_y))
 
     @staticmethod
     def interpolate_3d_cross(x: ndarray,
@@ -162,10 +181,14 @@ class CPUBackend(BaseBackend):
                              x_min: float,
                              x_max: float,
                              y_min: float,
-                             y_max: float) -> ndarray:
+                             y_max: float,
+                             out: Optional[ndarray] = None) -> ndarray:
+        if out is None:
+            out = np.empty((y_pixels, x_pixels), dtype=weight.dtype)
         return CPUBackend._fast_2d(x, y, z, z_slice, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 3)
+                                   y_pixels, x_min, x_max, y_min, y_max, 3,
+                                   out)
 
     @staticmethod
     def interpolate_3d_cross_vec(x: ndarray,
@@ -183,12 +206,16 @@ class CPUBackend(BaseBackend):
                                  x_max: float,
                                  y_min: float,
                                  y_max: float) -> Tuple[ndarray, ndarray]:
+        image_x = np.empty((y_pixels, x_pixels), dtype=weight_x.dtype)
+        image_y = np.empty((y_pixels, x_pixels), dtype=weight_y.dtype)
         return (CPUBackend._fast_2d(x, y, z, z_slice, weight_x, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 3),
+                                    y_pixels, x_min, x_max, y_min, y_max, 3,
+                                    image_x),
                 CPUBackend._fast_2d(x, y, z, z_slice, weight_y, h,
                                     weight_function, kernel_radius, x_pixels,
-                                    y_pixels, x_min, x_max, y_min, y_max, 3))
+                                    y_pixels, x_min, x_max, y_min, y_max, 3,
+                                    image_y))
 
     @staticmethod
     def interpolate_3d_grid(x: ndarray,
@@ -206,25 +233,25 @@ class CPUBackend(BaseBackend):
                             y_min: float,
                             y_max: float,
                             z_min: float,
-                            z_max: float) -> ndarray:
-        image = np.zeros((z_pixels, y_pixels, x_pixels))
+                            z_max: float,
+                            out: Optional[ndarray] = None) -> ndarray:
+        if out is None:
+            out = np.empty((z_pixels, y_pixels, x_pixels), dtype=weight.dtype)
         pixwidthz = (z_max - z_min) / z_pixels
 
+        # each slice is interpolated directly into the output grid.
         for z_i in np.arange(z_pixels):
             z_val = z_min + (z_i + 0.5) * pixwidthz
-            image[z_i] = CPUBackend._fast_2d(x, y, z, z_val, weight, h,
-                                             weight_function, kernel_radius,
-                                             x_pixels, y_pixels, x_min, x_max,
-                                             y_min, y_max, 3)
-
-        return image
+            CPUBackend._fast_2d(x, y, z, z_val, weight, h, weight_function,
+                                kernel_radius, x_pixels, y_pixels, x_min,
+                                x_max, y_min, y_max, 3, out[z_i])
 
-    # Underlying CPU numba-compiled code for interpolation to a 2D grid. Used
-    # in interpolation of 2D data, and column integration / cross-sections of
-    # 3D data.
+        return out
 
+    # Interpolation to a 2D grid. Used in interpolation of 2D data, and column
+    # integration / cross-sections of 3D data. The accumulation path is chosen
+    # here, so that only the compiled routine that runs is ever compiled.
     @staticmethod
-    @njit(parallel=True, fastmath=True)
     def _fast_2d(x_data: ndarray,
                  y_data: ndarray,
                  z_data: ndarray,
@@ -239,18 +266,162 @@ class CPUBackend(BaseBackend):
                  x_max: float,
                  y_min: float,
                  y_max: float,
-                 n_dims: int) -> ndarray:
-        output = np.zeros((y_pixels, x_pixels))
+                 n_dims: int,
+                 output: ndarray) -> ndarray:
         pixwidthx = (x_max - x_min) / x_pixels
         pixwidthy = (y_max - y_min) / y_pixels
         if not n_dims == 2:
-            dz = np.subtract(np.float64(z_slice), z_data)
+            dz = np.float64(z_slice) - z_data
         else:
             dz = np.zeros(x_data.size)
 
-        term = w_data / h_data ** n_dims
+        # determine the weight of each particle, and the pixels that it
+        # contributes to, in a single pass over the particles.
+        term = np.empty(x_data.size, dtype=w_data.dtype)
+        ipixmin = np.empty(x_data.size, dtype=np.int32)
+        ipixmax = np.empty(x_data.size, dtype=np.int32)
+        jpixmin = np.empty(x_data.size, dtype=np.int32)
+        jpixmax = np.empty(x_data.size, dtype=np.int32)
+        compute_bounds_and_term(x_data, y_data, dz, w_data, h_data,
+                                kernel_radius, x_min, y_min, pixwidthx,
+                                pixwidthy, x_pixels, y_pixels, n_dims, term,
+                                ipixmin, ipixmax, jpixmin, jpixmax)
+
+        # the image is split into square tiles of pixels, which are made
+        # smaller until every thread has several tiles to work on.
+        tile_size = 64
+        x_tiles = (x_pixels + tile_size - 1) // tile_size
+        y_tiles = (y_pixels + tile_size - 1) // tile_size
+        while tile_size > 16 and x_tiles * y_tiles < 4 * get_num_threads():
+            tile_size //= 2
+            x_tiles = (x_pixels + tile_size - 1) // tile_size
+            y_tiles = (y_pixels + tile_size - 1) // tile_size
+
+        # small images that still have fewer tiles than threads are split by
+        # particle instead.
+        if x_tiles * y_tiles < get_num_threads():
+            return CPUBackend._fast_2d_scatter(x_data, y_data, dz, h_data,
+                                               term, ipixmin, ipixmax,
+                                               jpixmin, jpixmax,
+                                               weight_function, kernel_radius,
+                                               x_min, y_min, pixwidthx,
+                                               pixwidthy, n_dims, output)
+
+        # particles are sorted into every tile that they contribute to, and
+        # their fields gathered in that order, so that each tile reads its
+        # particles contiguously.
+        cell_start, cell_count, particles, bounds = \
+            bin_particles(x_data, y_data, dz, h_data, term, ipixmin, ipixmax,
+                          jpixmin, jpixmax, tile_size, x_tiles, y_tiles,
+                          get_num_threads())
+        return CPUBackend._fast_2d_tiles(particles, bounds, cell_start,
+                                         cell_count, tile_size, x_tiles,
+                                         y_tiles, weight_function,
+                                         kernel_radius, x_pixels, y_pixels,
+                                         x_min, y_min, pixwidthx, pixwidthy,
+                                         n_dims, output)
+
+    # Underlying CPU numba-compiled code for accumulating binned particles
+    # into tiles of a 2D grid. Like the other _fast_* routines, this is not
+    # cached to disk, since it is compiled separately for each weight
+    # function, and column kernel functions are closures that are rebuilt in
+    # every session.
+    @staticmethod
+    @njit(parallel=True, fastmath=True, nogil=True)
+    def _fast_2d_tiles(particles: ndarray,
+                       bounds: ndarray,
+                       cell_start: ndarray,
+                       cell_count: ndarray,
+                       tile_size: int,
+                       x_tiles: int,
+                       y_tiles: int,
+                       weight_function: CPUDispatcher,
+                       kernel_radius: float,
+                       x_pixels: int,
+                       y_pixels: int,
+                       x_min: float,
+                       y_min: float,
+                       pixwidthx: float,
+                       pixwidthy: float,
+                       n_dims: int,
+                       output: ndarray) -> ndarray:
+        # pixels are compared against the squared kernel radius, so that the
+        # square root is only taken for pixels that the particle contributes to
+        kernel_radius2 = kernel_radius * kernel_radius
 
-        output_local = np.zeros((get_num_threads(), y_pixels, x_pixels))
+        # thread safety:
+        # each tile is accumulated in a local buffer by a single thread, so no
+        # two threads ever write to the same pixel. Every pixel of output is
+        # written once, so callers can pass an uninitialised array.
+        for tile in prange(x_tiles * y_tiles):
+            ti0 = (tile % x_tiles) * tile_size
+            tj0 = (tile // x_tiles) * tile_size
+            ti1 = min(ti0 + tile_size, x_pixels)
+            tj1 = min(tj0 + tile_size, y_pixels)
+            local = np.zeros((tile_size, tile_size), dtype=output.dtype)
+
+            for k in range(cell_start[tile],
+                           cell_start[tile] + cell_count[tile]):
+                x_i = particles[k, 0]
+                y_i = particles[k, 1]
+                dz_i = particles[k, 2]
+                h_i = particles[k, 3]
+                term_i = particles[k, 4]
+                inv_h2 = 1 / h_i ** 2
+
+                # pixels outside of the kernel radius are masked by the
+                # comparison against q2 below, which vectorizes better than
+                # narrowing each row to the particle's smoothing circle.
+                istart = max(bounds[k, 0], ti0)
+                iend = min(bounds[k, 1], ti1)
+                for jpix in range(max(bounds[k, 2], tj0),
+                                  min(bounds[k, 3], tj1)):
+                    ypix = y_min + (jpix + 0.5) * pixwidthy
+                    dy = ypix - y_i
+                    dyz2 = dy * dy + dz_i * dz_i
+
+                    # pixels are indexed from zero within a view of the row,
+                    # since signed indices that may be negative are wrapped
+                    # around by numba, which prevents vectorization.
+                    row = local[jpix - tj0, istart - ti0:iend - ti0]
+                    dx0 = x_min + (istart + 0.5) * pixwidthx - x_i
+                    for ipix in range(iend - istart):
+                        dx = dx0 + ipix * pixwidthx
+                        q2 = (dx * dx + dyz2) * inv_h2
+                        if q2 > kernel_radius2:
+                            continue
+                        wab = weight_function(np.sqrt(q2), n_dims)
+                        row[ipix] += term_i * wab
+
+            output[tj0:tj1, ti0:ti1] = local[:tj1 - tj0, :ti1 - ti0]
+
+        return output
+
+    # Underlying CPU numba-compiled code for accumulating particles into a 2D
+    # grid, split by particle between threads. Used for images that are too
+    # small to give every thread a tile.
+    @staticmethod
+    @njit(parallel=True, fastmath=True, nogil=True)
+    def _fast_2d_scatter(x_data: ndarray,
+                         y_data: ndarray,
+                         dz: ndarray,
+                         h_data: ndarray,
+                         term: ndarray,
+                         ipixmin: ndarray,
+                         ipixmax: ndarray,
+                         jpixmin: ndarray,
+                         jpixmax: ndarray,
+                         weight_function: CPUDispatcher,
+                         kernel_radius: float,
+                         x_min: float,
+                         y_min: float,
+                         pixwidthx: float,
+                         pixwidthy: float,
+                         n_dims: int,
+                         output: ndarray) -> ndarray:
+        kernel_radius2 = kernel_radius * kernel_radius
+        output_local = np.zeros((get_num_threads(), output.shape[0],
+                                 output.shape[1]), dtype=output.dtype)
 
         # thread safety:
         # each thread has its own grid, which are combined after interpolation
@@ -259,55 +430,30 @@ class CPUBackend(BaseBackend):
             range_start = int(thread * block_size)
             range_end = int((thread + 1) * block_size)
 
-            # iterate through the indexes of non-filtered particles
             for i in range(range_start, range_end):
-                if np.abs(dz[i]) >= kernel_radius * h_data[i]:
-                    continue
-
-                rad = kernel_radius * h_data[i]
-
-                # determine pixels that this particle contributes to
-                ipixmin = int(np.rint((x_data[i] - rad - x_min) / pixwidthx))
-                jpixmin = int(np.rint((y_data[i] - rad - y_min) / pixwidthy))
-                ipixmax = int(np.rint((x_data[i] + rad - x_min) / pixwidthx))
-                jpixmax = int(np.rint((y_data[i] + rad - y_min) / pixwidthy))
-
-                if ipixmax < 0 or ipixmin > x_pixels:
-                    continue
-                if jpixmax < 0 or jpixmin > y_pixels:
-                    continue
-
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
-
-                # precalculate differences in the x-direction (optimization)
-                dx2i = ((x_min + (np.arange(ipixmin, ipixmax) + 0.5)
-                         * pixwidthx - x_data[i])**2 + dz[i]**2) / h_data[i]**2
-
-                # determine differences in the y-direction
-                ypix = y_min + (np.arange(jpixmin, jpixmax) + 0.5) * pixwidthy
-                dy = ypix - y_data[i]
-                dy2 = dy * dy * (1 / (h_data[i] ** 2))
+                x_i = x_data[i]
+                y_i = y_data[i]
+                dz_i = dz[i]
+                term_i = term[i]
+                inv_h2 = 1 / h_data[i] ** 2
 
-                # calculate contributions at pixels i, j from particle at x, y
-                q2 = dx2i + dy2.reshape(len(dy2), 1)
-
-                for jpix in range(jpixmax - jpixmin):
-                    for ipix in range(ipixmax - ipixmin):
-                        if np.sqrt(q2[jpix][ipix]) > kernel_radius:
+                for jpix in range(jpixmin[i], jpixmax[i]):
+                    ypix = y_min + (jpix + 0.5) * pixwidthy
+                    dy = ypix - y_i
+                    dyz2 = dy * dy + dz_i * dz_i
+
+                    row = output_local[thread, jpix, ipixmin[i]:ipixmax[i]]
+                    dx0 = x_min + (ipixmin[i] + 0.5) * pixwidthx - x_i
+                    for ipix in range(ipixmax[i] - ipixmin[i]):
+                        dx = dx0 + ipix * pixwidthx
+                        q2 = (dx * dx + dyz2) * inv_h2
+                        if q2 > kernel_radius2:
                             continue
-                        wab = weight_function(np.sqrt(q2[jpix][ipix]), n_dims)
-                        jp = jpix + jpixmin
-                        ip = ipix + ipixmin
-                        output_local[thread][jp, ip] += term[i] * wab
+                        wab = weight_function(np.sqrt(q2), n_dims)
+                        row[ipix] += term_i * wab
 
-        for i in range(get_num_threads()):
+        output[:] = output_local[0]
+        for i in range(1, get_num_threads()):
             output += output_local[i]
 
         return output
@@ -315,7 +461,7 @@ class CPUBackend(BaseBackend):
     # Underlying CPU numba-compiled code for exact interpolation of 2D data to
     # a 2D grid.
     @staticmethod
-    @njit(parallel=True)
+    @njit(parallel=True, nogil=True)
     def _exact_2d_render(x_data: ndarray,
                          y_data: ndarray,
                          w_data: ndarray,
@@ -448,7 +594,7 @@ class CPUBackend(BaseBackend):
 
     # Underlying CPU numba-compiled code for 2D->1D cross-sections.
     @staticmethod
-    @njit(parallel=True, fastmath=True)
+    @njit(parallel=True, fastmath=True, nogil=True)
     def _fast_2d_line(x_data: ndarray,
                       y_data: ndarray,
                       w_data: ndarray,
@@ -471,8 +617,6 @@ class CPUBackend(BaseBackend):
         pixwidth = xlength / pixels
         xpixwidth = (x2 - x1) / pixels
 
-        term = w_data / h_data ** 2
-
         # the intersections between the line and a particle's 'smoothing
         # circle' are found by solving a quadratic equation with the below
         # values of a, b, and c. if the determinant is negative, the particle
@@ -483,27 +627,39 @@ class CPUBackend(BaseBackend):
             + yint**2 - (kernel_radius * h_data)**2
         det = bb ** 2 - 4 * aa * det
 
-        # create a filter for particles that do not contribute
-        filter = det >= 0
-        det = np.sqrt(det)
+        # gather the contributing particles into contiguous arrays once,
+        # outside of the main loop, so that the weight and square root are
+        # only computed for particles that contribute.
+        idx = np.nonzero(det >= 0)[0]
+        x_filter = x_data[idx]
+        y_filter = y_data[idx]
+        h_filter = h_data[idx]
+        term_filter = w_data[idx] / h_filter ** 2
+        bb_filter = bb[idx]
+        det_filter = np.sqrt(det[idx])
 
         output = np.zeros(pixels)
 
-        # the starting and ending x coordinates of the lines intersections with
-        # a particle's smoothing circle
-        rstart = ((-bb[filter] - det[filter])
-                  / (2 * aa)).clip(a_min=x1, a_max=x2)
-        rend = ((-bb[filter] + det[filter])
-                / (2 * aa)).clip(a_min=x1, a_max=x2)
-
-        # start and end distances that are within a particle's smoothing circle
-        rstart = np.sqrt((rstart - x1)**2
-                         + ((gradient * rstart + yint) - y1)**2)
-        rend = np.sqrt((rend - x1)**2 + (((gradient * rend + yint) - y1)**2))
-
-        # the maximum and minimum pixels that each particle contributes to.
-        ipixmin = np.rint(rstart / pixwidth).clip(a_min=0, a_max=pixels)
-        ipixmax = np.rint(rend / pixwidth).clip(a_min=0, a_max=pixels)
+        # the minimum and maximum pixels that each particle contributes to,
+        # clamped to the line in a single pass over the particles.
+        ipixmin = np.empty(x_filter.size, dtype=np.int32)
+        ipixmax = np.empty(x_filter.size, dtype=np.int32)
+        for i in prange(x_filter.size):
+            # the starting and ending x coordinates of the lines intersections
+            # with a particle's smoothing circle
+            xstart = min(max((-bb_filter[i] - det_filter[i]) / (2 * aa), x1),
+                         x2)
+            xend = min(max((-bb_filter[i] + det_filter[i]) / (2 * aa), x1),
+                       x2)
+
+            # start and end distances that are within the smoothing circle
+            rstart = np.sqrt((xstart - x1)**2
+                             + ((gradient * xstart + yint) - y1)**2)
+            rend = np.sqrt((xend - x1)**2
+                           + ((gradient * xend + yint) - y1)**2)
+
+            ipixmin[i] = int(min(max(np.rint(rstart / pixwidth), 0), pixels))
+            ipixmax[i] = int(min(max(np.rint(rend / pixwidth), 0), pixels))
 
         output_local = np.zeros((get_num_threads(), pixels))
 
@@ -511,26 +667,33 @@ class CPUBackend(BaseBackend):
         # each thread has its own grid, which are combined after interpolation
         for thread in prange(get_num_threads()):
 
-            block_size = len(x_data[filter]) / get_num_threads()
+            block_size = x_filter.size / get_num_threads()
             range_start = thread * block_size
             range_end = (thread + 1) * block_size
 
             # iterate through the indices of all non-filtered particles
             for i in range(range_start, range_end):
+                # skip particles that miss every pixel, or carry no weight
+                if ipixmax[i] <= ipixmin[i] or term_filter[i] == 0:
+                    continue
+
+                x_i = x_filter[i]
+                y_i = y_filter[i]
+                inv_h2 = 1 / h_filter[i] ** 2
+                term_i = term_filter[i]
+
                 # determine contributions to all pixels for this particle
-                xpix = x1 + (np.arange(int(ipixmin[i]), int(ipixmax[i]))
-                             + 0.5) * xpixwidth
-                ypix = gradient * xpix + yint
-                dy = ypix - y_data[filter][i]
-                dx = xpix - x_data[filter][i]
+                for ipix in range(ipixmin[i], ipixmax[i]):
+                    xpix = x1 + (ipix + 0.5) * xpixwidth
+                    ypix = gradient * xpix + yint
+                    dy = ypix - y_i
+                    dx = xpix - x_i
 
-                q2 = (dx**2 + dy**2) / h_data[filter][i]**2
-                wab = weight_function(np.sqrt(q2), 2)
+                    q2 = (dx * dx + dy * dy) * inv_h2
+                    wab = weight_function(np.sqrt(q2), 2)
 
-                # add contributions to output total
-                for ipix in range(int(ipixmax[i]) - int(ipixmin[i])):
-                    ip = ipix + int(ipixmin[i])
-                    output_local[thread][ip] += term[filter][i] * wab[ipix]
+                    # add contributions to output total
+                    output_local[thread][ipix] += term_i * wab
 
         for i in range(get_num_threads()):
             output += output_local[i]
@@ -538,7 +701,7 @@ class CPUBackend(BaseBackend):
         return output
 
     @staticmethod
-    @njit(parallel=True, fastmath=True)
+    @njit(parallel=True, fastmath=True, nogil=True)
     def _fast_3d_line(x_data: ndarray,
                       y_data: ndarray,
                       z_data: ndarray,
@@ -569,6 +732,8 @@ class CPUBackend(BaseBackend):
             range_end = int((thread + 1) * block_size)
 
             for i in range(range_start, range_end):
+                if term[i] == 0:
+                    continue
 
                 dx = x1 - x_data[i]
                 dy = y1 - y_data[i]
@@ -583,23 +748,25 @@ class CPUBackend(BaseBackend):
 
                 pixmin = min(max(0, round((d1 / length) * pixels)), pixels)
                 pixmax = min(max(0, round((d2 / length) * pixels)), pixels)
+                if pixmax <= pixmin:
+                    continue
+
+                inv_h2 = 1 / h_data[i] ** 2
 
-                xpix = x1 + (np.arange(pixmin, pixmax)
-                             + 0.5) * (x2 - x1) / pixels
-                ypix = y1 + (np.arange(pixmin, pixmax)
-                             + 0.5) * (y2 - y1) / pixels
-                zpix = z1 + (np.arange(pixmin, pixmax)
-                             + 0.5) * (z2 - z1) / pixels
+                for ipix in range(pixmin, pixmax):
+                    xpix = x1 + (ipix + 0.5) * (x2 - x1) / pixels
+                    ypix = y1 + (ipix + 0.5) * (y2 - y1) / pixels
+                    zpix = z1 + (ipix + 0.5) * (z2 - z1) / pixels
 
-                xdiff = xpix - x_data[i]
-                ydiff = ypix - y_data[i]
-                zdiff = zpix - z_data[i]
+                    xdiff = xpix - x_data[i]
+                    ydiff = ypix - y_data[i]
+                    zdiff = zpix - z_data[i]
 
-                q2 = (xdiff**2 + ydiff**2 + zdiff**2) / h_data[i]**2
-                wab = weight_function(np.sqrt(q2), 3)
+                    q2 = (xdiff * xdiff + ydiff * ydiff + zdiff * zdiff) \
+                        * inv_h2
+                    wab = weight_function(np.sqrt(q2), 3)
 
-                for ipix in range(pixmax - pixmin):
-                    output_local[thread][ipix + pixmin] += term[i] * wab[ipix]
+                    output_local[thread][ipix] += term[i] * wab
 
         output = np.zeros(pixels)
 
@@ -609,7 +776,7 @@ class CPUBackend(BaseBackend):
         return output
 
     @staticmethod
-    @njit(parallel=True)
+    @njit(parallel=True, nogil=True)
     def _exact_3d_project(x_data: ndarray,
                           y_data: ndarray,
                           w_data: ndarray,
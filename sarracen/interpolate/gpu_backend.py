@@ -1,12 +1,13 @@
 import math
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-from numba import cuda
+from numba import cuda, get_num_threads
 from numba.core.registry import CPUDispatcher
 from numpy import ndarray
 
 from ..interpolate.base_backend import BaseBackend
+from ..interpolate.binning import bin_particles, compute_bounds_and_term
 from ..kernels.cubic_spline_exact import line_int, surface_int
 
 
@@ -25,14 +26,17 @@ class GPUBackend(BaseBackend):
                               x_max: float,
                               y_min: float,
                               y_max: float,
-                              exact: bool) -> ndarray:
+                              exact: bool,
+                              out: Optional[ndarray] = None) -> ndarray:
         if exact:
-            return GPUBackend._exact_2d_render(x, y, weight, h, x_pixels,
-                                               y_pixels, x_min, x_max,
-                                               y_min, y_max)
+            image = GPUBackend._exact_2d_render(x, y, weight, h, x_pixels,
+                                                y_pixels, x_min, x_max,
+                                                y_min, y_max)
+            return GPUBackend._store(image, out)
         return GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   out)
 
     @staticmethod
     def interpolate_2d_render_vec(x: ndarray,
@@ -110,14 +114,17 @@ class GPUBackend(BaseBackend):
                                   x_max: float,
                                   y_min: float,
                                   y_max: float,
-                                  exact: bool) -> ndarray:
+                                  exact: bool,
+                                  out: Optional[ndarray] = None) -> ndarray:
         if exact:
-            return GPUBackend._exact_3d_project(x, y, weight, h, x_pixels,
-                                                y_pixels, x_min, x_max,
-                                                y_min, y_max)
+            image = GPUBackend._exact_3d_project(x, y, weight, h, x_pixels,
+                                                 y_pixels, x_min, x_max,
+                                                 y_min, y_max)
+            return GPUBackend._store(image, out)
         return GPUBackend._fast_2d(x, y, np.zeros(x.size), 0, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 2)
+                                   y_pixels, x_min, x_max, y_min, y_max, 2,
+                                   out)
 
     @staticmethod
     def interpolate_3d_projection_vec(x: ndarray,
@@ -162,10 +169,12 @@ class GPUBackend(BaseBackend):
                              x_min: float,
                              x_max: float,
                              y_min: float,
-                             y_max: float) -> ndarray:
+                             y_max: float,
+                             out: Optional[ndarray] = None) -> ndarray:
         return GPUBackend._fast_2d(x, y, z, z_slice, weight, h,
                                    weight_function, kernel_radius, x_pixels,
-                                   y_pixels, x_min, x_max, y_min, y_max, 3)
+                                   y_pixels, x_min, x_max, y_min, y_max, 3,
+                                   out)
 
     @staticmethod
     def interpolate_3d_cross_vec(x: ndarray,
@@ -206,20 +215,21 @@ class GPUBackend(BaseBackend):
                             y_min: float,
                             y_max: float,
                             z_min: float,
-                            z_max: float) -> ndarray:
-        image = np.zeros((z_pixels, y_pixels, x_pixels))
+                            z_max: float,
+                            out: Optional[ndarray] = None) -> ndarray:
+        if out is None:
+            out = np.empty((z_pixels, y_pixels, x_pixels), dtype=weight.dtype)
         pixwidthz = (z_max - z_min) / z_pixels
 
         # todo: this should be separated from _fast_2d to reduce the
         #  unnecessary transfer of data to the graphics card.
         for z_i in np.arange(z_pixels):
             z_val = z_min + (z_i + 0.5) * pixwidthz
-            image[z_i] = GPUBackend._fast_2d(x, y, z, z_val, weight, h,
-                                             weight_function, kernel_radius,
-                                             x_pixels, y_pixels, x_min, x_max,
-                                             y_min, y_max, 3)
+            GPUBackend._fast_2d(x, y, z, z_val, weight, h, weight_function,
+                                kernel_radius, x_pixels, y_pixels, x_min,
+                                x_max, y_min, y_max, 3, out[z_i])
 
-        return image
+        return out
 
     # For the GPU, the numba code is compiled using a factory function
     # approach. This is required since a CUDA numba kernel cannot easily take
@@ -239,108 +249,108 @@ class GPUBackend(BaseBackend):
                  x_max: float,
                  y_min: float,
                  y_max: float,
-                 n_dims: int) -> ndarray:
+                 n_dims: int,
+                 output: Optional[ndarray] = None) -> ndarray:
+        pixwidthx = (x_max - x_min) / x_pixels
+        pixwidthy = (y_max - y_min) / y_pixels
+        if not n_dims == 2:
+            dz = np.float64(z_slice) - z_data
+        else:
+            dz = np.zeros(x_data.size)
+
+        # determine the weight of each particle, and the pixels that it
+        # contributes to, then sort particles into tiles of pixels so that
+        # each pixel only visits particles binned in its own tile. Tiles match
+        # the thread blocks, so all threads in a block read the same
+        # particles.
+        term = np.empty(x_data.size, dtype=w_data.dtype)
+        ipixmin = np.empty(x_data.size, dtype=np.int32)
+        ipixmax = np.empty(x_data.size, dtype=np.int32)
+        jpixmin = np.empty(x_data.size, dtype=np.int32)
+        jpixmax = np.empty(x_data.size, dtype=np.int32)
+        compute_bounds_and_term(x_data, y_data, dz, w_data, h_data,
+                                kernel_radius, x_min, y_min, pixwidthx,
+                                pixwidthy, x_pixels, y_pixels, n_dims, term,
+                                ipixmin, ipixmax, jpixmin, jpixmax)
+
+        tile_size = 16
+        x_tiles = (x_pixels + tile_size - 1) // tile_size
+        y_tiles = (y_pixels + tile_size - 1) // tile_size
+        cell_start, cell_count, particles, bounds = \
+            bin_particles(x_data, y_data, dz, h_data, term, ipixmin, ipixmax,
+                          jpixmin, jpixmax, tile_size, x_tiles, y_tiles,
+                          get_num_threads())
+
         # Underlying GPU numba-compiled code for interpolation to a 2D grid.
         # Used in interpolation of 2D data, and column integration /
         # cross-sections of 3D data.
         @cuda.jit(fastmath=True)
-        def _2d_func(z_slice: float,
-                     x_data: ndarray,
-                     y_data: ndarray,
-                     z_data: ndarray,
-                     w_data: ndarray,
-                     h_data: ndarray,
+        def _2d_func(particles: ndarray,
+                     bounds: ndarray,
+                     cell_start: ndarray,
+                     cell_count: ndarray,
+                     tile_size: int,
+                     x_tiles: int,
                      kernel_radius: float,
                      x_pixels: int,
                      y_pixels: int,
                      x_min: float,
-                     x_max: float,
                      y_min: float,
-                     y_max: float,
+                     pixwidthx: float,
+                     pixwidthy: float,
                      n_dims: int,
                      image) -> None:
-            pixwidthx = (x_max - x_min) / x_pixels
-            pixwidthy = (y_max - y_min) / y_pixels
-
-            i = cuda.grid(1)
-            if i < len(x_data):
-                if not n_dims == 2:
-                    dz = np.float64(z_slice) - z_data[i]
-                else:
-                    dz = 0
-
-                if abs(dz) >= kernel_radius * h_data[i]:
-                    return
-
-                term = w_data[i] / h_data[i]**n_dims
-                rad = kernel_radius * h_data[i]
-
-                # determine pixels that this particle contributes to
-                ipixmin = round((x_data[i] - rad - x_min) / pixwidthx)
-                jpixmin = round((y_data[i] - rad - y_min) / pixwidthy)
-                ipixmax = round((x_data[i] + rad - x_min) / pixwidthx)
-                jpixmax = round((y_data[i] + rad - y_min) / pixwidthy)
-
-                if ipixmax < 0 or ipixmin > x_pixels:
-                    return
-                if jpixmax < 0 or jpixmin > y_pixels:
-                    return
-
-                if ipixmin < 0:
-                    ipixmin = 0
-                if ipixmax > x_pixels:
-                    ipixmax = x_pixels
-                if jpixmin < 0:
-                    jpixmin = 0
-                if jpixmax > y_pixels:
-                    jpixmax = y_pixels
-
-                # calculate contributions to all nearby pixels
-                for jpix in range(jpixmax - jpixmin):
-                    for ipix in range(ipixmax - ipixmin):
-                        # determine difference in the x-direction
-                        xpix = x_min + ((ipix + ipixmin) + 0.5) * pixwidthx
-                        dx = xpix - x_data[i]
-                        dx2 = dx**2 / h_data[i]**2
-
-                        # determine difference in the y-direction
-                        ypix = y_min + ((jpix + jpixmin) + 0.5) * pixwidthy
-                        dy = ypix - y_data[i]
-                        dy2 = dy**2 / h_data[i]**2
-                        dz2 = dz**2 / h_data[i]**2
-
-                        # calculate contributions at pixels i, j due to
-                        # particle at x, y
-                        q = math.sqrt(dx2 + dy2 + dz2)
-
-                        # add contribution to image
-                        if q < kernel_radius:
-                            # atomic protects against race conditions.
-                            wab = weight_function(q, n_dims)
-                            jp = jpix + jpixmin
-                            ip = ipix + ipixmin
-                            cuda.atomic.add(image, (jp, ip), term * wab)
-
-        threadsperblock = 32
-        blockspergrid = (x_data.size + (threadsperblock-1)) // threadsperblock
+            # each thread gathers the contributions to a single pixel, so no
+            # atomics are needed.
+            ipix, jpix = cuda.grid(2)
+            if ipix >= x_pixels or jpix >= y_pixels:
+                return
+
+            xpix = x_min + (ipix + 0.5) * pixwidthx
+            ypix = y_min + (jpix + 0.5) * pixwidthy
+            tile = (jpix // tile_size) * x_tiles + ipix // tile_size
+
+            total = 0.0
+            for k in range(cell_start[tile],
+                           cell_start[tile] + cell_count[tile]):
+                if bounds[k, 0] <= ipix < bounds[k, 1] \
+                        and bounds[k, 2] <= jpix < bounds[k, 3]:
+                    dx = xpix - particles[k, 0]
+                    dy = ypix - particles[k, 1]
+                    dz = particles[k, 2]
+                    h = particles[k, 3]
+                    q2 = (dx * dx + dy * dy + dz * dz) / (h * h)
+
+                    if q2 < kernel_radius * kernel_radius:
+                        wab = weight_function(math.sqrt(q2), n_dims)
+                        total += particles[k, 4] * wab
+
+            image[jpix, ipix] = total
+
+        threadsperblock = (tile_size, tile_size)
+        blockspergrid = (x_tiles, y_tiles)
 
         # transfer relevant data to the GPU
-        d_x = cuda.to_device(x_data)
-        d_y = cuda.to_device(y_data)
-        d_z = cuda.to_device(z_data)
-        d_w = cuda.to_device(w_data)
-        d_h = cuda.to_device(h_data)
+        d_particles = cuda.to_device(particles)
+        d_bounds = cuda.to_device(bounds)
+        d_cell_start = cuda.to_device(cell_start)
+        d_cell_count = cuda.to_device(cell_count)
         # CUDA kernels have no return values, so the image data must be
         # allocated on the device beforehand.
-        d_image = cuda.to_device(np.zeros((y_pixels, x_pixels)))
+        d_image = cuda.device_array((y_pixels, x_pixels), dtype=w_data.dtype)
 
         # execute the newly compiled CUDA kernel.
-        _2d_func[blockspergrid, threadsperblock](z_slice, d_x, d_y, d_z, d_w,
-                                                 d_h, kernel_radius, x_pixels,
-                                                 y_pixels, x_min, x_max, y_min,
-                                                 y_max, n_dims, d_image)
-
-        return d_image.copy_to_host()
+        _2d_func[blockspergrid, threadsperblock](d_particles, d_bounds,
+                                                 d_cell_start, d_cell_count,
+                                                 tile_size, x_tiles,
+                                                 kernel_radius, x_pixels,
+                                                 y_pixels, x_min, y_min,
+                                                 pixwidthx, pixwidthy,
+                                                 n_dims, d_image)
+
+        if output is None:
+            return d_image.copy_to_host()
+        return d_image.copy_to_host(output)
 
     # Underlying CPU numba-compiled code for exact interpolation of 2D data
     # to a 2D grid.
@@ -1,17 +1,21 @@
-import math
-
 import numpy as np
-from numba import njit, prange
-from typing import Callable
+from numba import float32, float64, int64, njit, prange, vectorize
+from typing import Callable, Dict, Tuple
+
+
+# column kernels, and their compiled weight functions, are shared between all
+# instances of a kernel class, keyed by the kernel class and the number of
+# samples.
+_COLUMN_CACHE: Dict[Tuple[type, int], np.ndarray] = {}
+_COLUMN_FUNC_CACHE: Dict[Tuple[type, int], Callable[[float, int], float]] = {}
+
+# element-wise weight functions, compiled on first use for each kernel class.
+_W_VEC_CACHE: Dict[type, Callable[[np.ndarray, int], np.ndarray]] = {}
 
 
 class BaseKernel:
     """A generic kernel used for data interpolation."""
 
-    def __init__(self) -> None:
-        self._ckernel_func_cache = None
-        self._column_cache = None
-
     @staticmethod
     def get_radius() -> float:
         """Get the smoothing radius of this kernel."""
@@ -36,6 +40,36 @@ class BaseKernel:
 
         return 1
 
+    def w_vec(self, q: np.ndarray, dim: int) -> np.ndarray:
+        """ Get the normalized weight of this kernel for an array of values.
+
+        An element-wise, multithreaded version of w(), for evaluating the
+        kernel over arrays outside of numba-compiled code. It is compiled the
+        first time it is used for each kernel class. Single-precision input
+        is evaluated in single precision.
+
+        Parameters
+        ----------
+        q : ndarray
+            The values to evaluate this kernel at.
+        dim : {1, 2, 3}
+            The number of dimensions to normalize the kernel values for.
+
+        Returns
+        -------
+        ndarray
+            The normalized kernel weights at each value of `q`.
+        """
+        key = type(self)
+        if key not in _W_VEC_CACHE:
+            w = getattr(self.w, 'py_func', self.w)
+            _W_VEC_CACHE[key] = vectorize([float32(float32, int64),
+                                           float64(float64, int64)],
+                                          target='parallel',
+                                          fastmath=True)(w)
+
+        return _W_VEC_CACHE[key](q, dim)
+
     def get_column_kernel(self, samples: int = 1000) -> np.ndarray:
         """ Integrate a given 3D kernel over the z-axis.
 
@@ -50,20 +84,26 @@ class BaseKernel:
 
         Examples
         --------
-        Use np.linspace and np.interp to use this column kernel approximation:
-            np.interp(q,
-                      np.linspace(0, kernel.get_radius(), samples),
-                      column_kernel)
+        Use np.linspace and np.interp to use this column kernel approximation.
+        The sample grid only depends on the kernel, so build it once and
+        interpolate all values of q against it:
+            q_grid = np.linspace(0, kernel.get_radius(), samples)
+            np.interp(q, q_grid, column_kernel)
+
+        Inside numba-compiled loops, prefer get_column_kernel_func(), which
+        indexes the samples directly instead of searching a sample grid.
         """
-        if samples == 1000 and self._column_cache is not None:
-            return self._column_cache
-
-        c_kernel = BaseKernel._int_func(self.get_radius(), samples, self.w)
+        key = (type(self), samples)
+        if key not in _COLUMN_CACHE:
+            c_kernel = BaseKernel._int_func(self.get_radius(), samples,
+                                            self.w)
 
-        if samples == 1000:
-            self._column_cache = c_kernel
+            # the cached array is shared, so it must not be modified in place.
+            c_kernel.flags.writeable = False
+            _COLUMN_CACHE[key] = c_kernel
 
-        return c_kernel
+        # callers receive their own copy, which they are free to modify.
+        return _COLUMN_CACHE[key].copy()
 
     def get_column_kernel_func(self, samples: int) -> Callable[[float, int],
                                                                float]:
@@ -81,21 +121,30 @@ class BaseKernel:
         -------
         A numba-accelerated weight function.
         """
-        if self._ckernel_func_cache is not None and samples == 1000:
-            return self._ckernel_func_cache
+        # interpolation routines are compiled separately for each weight
+        # function they are given, so the same function must be returned
+        # every time to reuse those compiled routines.
+        key = (type(self), samples)
+        if key in _COLUMN_FUNC_CACHE:
+            return _COLUMN_FUNC_CACHE[key]
+
+        # the last sample is repeated, so that the sample after a clamped
+        # index is always valid.
         column_kernel = self.get_column_kernel(samples)
-        radius = self.get_radius()
+        column_kernel = np.append(column_kernel, column_kernel[-1])
+        inv_dq = (samples - 1) / self.get_radius()
 
         @njit(fastmath=True)
         def func(q: float, dim: int) -> float:
             # using np.linspace() would break compatibility with the GPU
             # backend, so the calculation here is performed manually.
-            wab_index = q * (samples - 1) / radius
-            index = min(max(0, int(math.floor(wab_index))), samples - 1)
-            index1 = min(max(0, int(math.ceil(wab_index))), samples - 1)
+            wab_index = min(max(0.0, q * inv_dq), samples - 1)
+            index = int(wab_index)
             t = wab_index - index
-            return column_kernel[index] * (1 - t) + column_kernel[index1] * t
+            return column_kernel[index] * (1 - t) \
+                + column_kernel[index + 1] * t
 
+        _COLUMN_FUNC_CACHE[key] = func
         return func
 
     # Internal function for performing the integral in _get_column_kernel()
@@ -109,9 +158,15 @@ class BaseKernel:
         for i in prange(samples):
             q_xy = radius * i / (samples - 1)
             bounds = np.sqrt(radius ** 2 - q_xy ** 2)
-            q_z = np.linspace(0, bounds, samples)
-            q = np.sqrt(q_xy ** 2 + q_z ** 2)
-            y = wfunc(q, 3)
-            result[i] = 2 * float(np.trapz(y, x=q_z))
+            dq_z = bounds / (samples - 1)
+
+            # trapezoidal rule over q_z in [0, bounds], with the half-weighted
+            # endpoints taken out of the loop over interior samples.
+            total = 0.5 * (wfunc(q_xy, 3)
+                           + wfunc(np.sqrt(q_xy ** 2 + bounds ** 2), 3))
+            for j in range(1, samples - 1):
+                q_z = j * dq_z
+                total += wfunc(np.sqrt(q_xy ** 2 + q_z ** 2), 3)
+            result[i] = 2 * total * dq_z
 
         return result
@@ -18,5 +18,8 @@ class CubicSplineKernel(BaseKernel):
             else 10 / (7 * np.pi) if (ndim == 2) \
             else 1 / np.pi
 
-        return norm * ((1 - 1.5 * q**2 + 0.75 * q**3) * (0 <= q) * (q < 1)
-                       + 0.25 * (2 - q)**3 * (1 <= q) * (q < 2))
+        # branchless form of the piecewise kernel, (2 - q)^3 - 4 (1 - q)^3
+        # on [0, 1) and (2 - q)^3 on [1, 2).
+        a = np.maximum(0.0, 2.0 - q)
+        b = np.maximum(0.0, 1.0 - q)
+        return norm * 0.25 * (a * a * a - 4.0 * b * b * b) * (0 <= q)
@@ -1114,6 +1114,44 @@ def test_oob_particles(backend: str) -> None:
                 assert img[z][y][x] == approx(weight[0] * sdf_3['A'][0] * w)
 
 
+@mark.parametrize("backend", backends)
+def test_varied_smoothing_lengths(backend: str) -> None:
+    """
+    Interpolation over many particles with a wide range of smoothing lengths,
+    both inside and outside of the image, should be equal to the sum of
+    contributions at each point.
+    """
+    kernel = CubicSplineKernel()
+    rng = np.random.default_rng(5)
+
+    data = {'x': rng.uniform(-1.5, 1.5, 40), 'y': rng.uniform(-1.5, 1.5, 40),
+            'z': rng.uniform(-0.5, 0.5, 40), 'A': rng.uniform(1, 3, 40),
+            'h': rng.uniform(0.05, 0.6, 40), 'rho': rng.uniform(0.5, 1.5, 40),
+            'm': rng.uniform(0.01, 0.1, 40)}
+    sdf = SarracenDataFrame(data, params=dict())
+    sdf.kernel = kernel
+    sdf.backend = backend
+
+    # A mapping of pixel indices to x / y values in particle space.
+    real_x = -1 + (np.arange(0, 20) + 0.5) * (2 / 20)
+    real_y = -1 + (np.arange(0, 15) + 0.5) * (2.2 / 15)
+
+    img = interpolate_3d_cross(sdf, 'A',
+                               x_pixels=20, y_pixels=15,
+                               xlim=(-1, 1), ylim=(-1, 1.2),
+                               z_slice=0.1,
+                               normalize=False, hmin=False)
+
+    weight = sdf['m'] / (sdf['rho'] * sdf['h'] ** 3)
+    for y in range(15):
+        for x in range(20):
+            r = np.sqrt((real_x[x] - sdf['x']) ** 2
+                        + (real_y[y] - sdf['y']) ** 2
+                        + (0.1 - sdf['z']) ** 2)
+            w = [kernel.w(q, 3) for q in r / sdf['h']]
+            assert img[y][x] == approx(np.sum(weight * sdf['A'] * w))
+
+
 @mark.parametrize("backend", backends)
 def test_invalid_region(backend: str) -> None:
     """
@@ -1561,3 +1599,110 @@ def test_minimum_smoothing_length_1d_lines(backend: str) -> None:
                                     normalize=False, hmin=True)
 
     assert (grid == grid_hmin).all()
+
+
+@mark.parametrize("backend", backends)
+def test_float32(backend: str) -> None:
+    """
+    Interpolation with float32 data should return a float32 image, that
+    agrees with float64 interpolation to within single precision.
+    """
+    rng = np.random.default_rng(7)
+
+    data = {'x': rng.uniform(-1, 1, 50), 'y': rng.uniform(-1, 1, 50),
+            'z': rng.uniform(-1, 1, 50), 'A': rng.uniform(1, 3, 50),
+            'B': rng.uniform(1, 3, 50), 'C': rng.uniform(1, 3, 50),
+            'h': rng.uniform(0.1, 0.5, 50), 'rho': rng.uniform(0.5, 1.5, 50),
+            'm': rng.uniform(0.01, 0.1, 50)}
+    sdf = SarracenDataFrame(data, params=dict())
+    sdf.backend = backend
+
+    kwargs: Dict[str, Any] = {'x_pixels': 20, 'y_pixels': 15,
+                              'xlim': (-1, 1), 'ylim': (-1, 1)}
+    for func in [interpolate_3d_proj, interpolate_3d_cross]:
+        img = func(sdf, 'A', **kwargs)
+        img_32 = func(sdf, 'A', dtype=np.float32, **kwargs)
+        assert img_32.dtype == np.float32
+        assert_allclose(img_32, img, rtol=1e-4, atol=1e-6)
+
+    for func in [interpolate_3d_vec, interpolate_3d_cross_vec]:
+        imgs = func(sdf, 'A', 'B', 'C', **kwargs)
+        imgs_32 = func(sdf, 'A', 'B', 'C', dtype=np.float32, **kwargs)
+        for img, img_32 in zip(imgs, imgs_32):
+            assert img_32.dtype == np.float32
+            assert_allclose(img_32, img, rtol=1e-4, atol=1e-6)
+
+    img = interpolate_3d_grid(sdf, 'A', z_pixels=10, **kwargs)
+    img_32 = interpolate_3d_grid(sdf, 'A', z_pixels=10, dtype=np.float32,
+                                 **kwargs)
+    assert img_32.dtype == np.float32
+    assert_allclose(img_32, img, rtol=1e-4, atol=1e-6)
+
+    sdf_2d = SarracenDataFrame({key: data[key] for key in
+                                ['x', 'y', 'A', 'B', 'h', 'rho', 'm']},
+                               params=dict())
+    sdf_2d.backend = backend
+
+    img = interpolate_2d(sdf_2d, 'A', **kwargs)
+    img_32 = interpolate_2d(sdf_2d, 'A', dtype=np.float32, **kwargs)
+    assert img_32.dtype == np.float32
+    assert_allclose(img_32, img, rtol=1e-4, atol=1e-6)
+
+    imgs = interpolate_2d_vec(sdf_2d, 'A', 'B', **kwargs)
+    imgs_32 = interpolate_2d_vec(sdf_2d, 'A', 'B', dtype=np.float32, **kwargs)
+    for img, img_32 in zip(imgs, imgs_32):
+        assert img_32.dtype == np.float32
+        assert_allclose(img_32, img, rtol=1e-4, atol=1e-6)
+
+    with raises(ValueError):
+        interpolate_2d(sdf_2d, 'A', dtype=np.int32, **kwargs)
+    with raises(ValueError):
+        interpolate_3d_proj(sdf, 'A', dtype=np.int64, **kwargs)
+
+
+@mark.parametrize("backend", backends)
+def test_out_buffer(backend: str) -> None:
+    """
+    Interpolation into a preallocated array should return that array, filled
+    with the same image as a regular interpolation.
+    """
+    rng = np.random.default_rng(9)
+
+    data = {'x': rng.uniform(-1, 1, 50), 'y': rng.uniform(-1, 1, 50),
+            'z': rng.uniform(-1, 1, 50), 'A': rng.uniform(1, 3, 50),
+            'h': rng.uniform(0.1, 0.5, 50), 'rho': rng.uniform(0.5, 1.5, 50),
+            'm': rng.uniform(0.01, 0.1, 50)}
+    sdf = SarracenDataFrame(data, params=dict())
+    sdf.backend = backend
+    sdf_2d = SarracenDataFrame({key: data[key] for key in
+                                ['x', 'y', 'A', 'h', 'rho', 'm']},
+                               params=dict())
+    sdf_2d.backend = backend
+
+    kwargs: Dict[str, Any] = {'x_pixels': 20, 'y_pixels': 15,
+                              'xlim': (-1, 1), 'ylim': (-1, 1)}
+    for func, df in [(interpolate_2d, sdf_2d), (interpolate_3d_proj, sdf),
+                     (interpolate_3d_cross, sdf)]:
+        for normalize in [True, False]:
+            out = np.full((15, 20), np.nan)
+            img = func(df, 'A', normalize=normalize, **kwargs)
+            img_out = func(df, 'A', normalize=normalize, out=out, **kwargs)
+            assert img_out is out
+            assert_allclose(img_out, img)
+
+        with raises(ValueError):
+            func(df, 'A', out=np.zeros((20, 15)), **kwargs)
+        with raises(ValueError):
+            func(df, 'A', dtype=np.float32, out=np.zeros((15, 20)), **kwargs)
+        with raises(ValueError):
+            func(df, 'A', out=np.zeros((15, 20), order='F'), **kwargs)
+
+    out = np.full((10, 15, 20), np.nan)
+    img = interpolate_3d_grid(sdf, 'A', z_pixels=10, **kwargs)
+    img_out = interpolate_3d_grid(sdf, 'A', z_pixels=10, out=out, **kwargs)
+    assert img_out is out
+    assert_allclose(img_out, img)
+
+    with raises(ValueError):
+        interpolate_3d_grid(sdf, 'A', z_pixels=10, dtype=np.float32,
+                            out=np.zeros((10, 15, 20)), **kwargs)
@@ -191,3 +191,48 @@ def test_oob(kernel: BaseKernel) -> None:
     column_func = kernel.get_column_kernel_func(1000)
     assert column_func(-1, 0) == column_func(0, 0)
     assert approx(column_func(kernel.get_radius() + 1, 0)) == 0
+
+
+def test_column_cache() -> None:
+    # column kernels are computed once for each kernel class and number of
+    # samples, and shared between instances of the same kernel class.
+    column_kernel = CubicSplineKernel().get_column_kernel(500)
+    assert CubicSplineKernel().get_column_kernel(500) \
+        == approx(column_kernel)
+    assert CubicSplineKernel().get_column_kernel(400).size == 400
+    assert QuinticSplineKernel().get_column_kernel(500) \
+        != approx(column_kernel)
+
+    # each call returns a writable copy of the shared column kernel.
+    column_kernel *= 2
+    assert CubicSplineKernel().get_column_kernel(500) \
+        == approx(column_kernel / 2)
+    assert CubicSplineKernel().get_column_kernel_func(500) \
+        is CubicSplineKernel().get_column_kernel_func(500)
+
+
+@mark.parametrize("kernel",
+                  [CubicSplineKernel(),
+                   QuarticSplineKernel(),
+                   QuinticSplineKernel()])
+def test_vectorized(kernel: BaseKernel) -> None:
+    q = np.linspace(-1, kernel.get_radius() + 1, 101)
+
+    for dimensions in range(1, 4):
+        expected = [kernel.w(x, dimensions) for x in q]
+        assert kernel.w_vec(q, dimensions) == approx(expected)
+
+    # single-precision input is evaluated in single precision.
+    assert kernel.w_vec(q.astype(np.float32), 3).dtype == np.float32
+
+
+@mark.parametrize("kernel",
+                  [CubicSplineKernel(),
+                   QuarticSplineKernel(),
+                   QuinticSplineKernel()])
+def test_array_input(kernel: BaseKernel) -> None:
+    q = np.linspace(-1, kernel.get_radius() + 1, 101)
+
+    for dimensions in range(1, 4):
+        expected = [kernel.w(x, dimensions) for x in q]
+        assert kernel.w(q, dimensions) == approx(expected)